@@ -3,10 +3,15 @@ CIS macOS Benchmark - Screen Lock Check
 Control ID: 5.9 - Ensure Screen Lock Timeout is Set
 """
 
-import subprocess
+import plistlib
+from pathlib import Path
+
 from src.checks.base_check import BaseCheck, CheckStatus, Severity
 
 
+_SCREENSAVER_PLIST = Path.home() / 'Library/Preferences/com.apple.screensaver.plist'
+
+
 class ScreenLockCheck(BaseCheck):
     """Check if screen lock timeout is configured"""
     
@@ -30,19 +35,39 @@ To configure screen lock:
 4. Set password requirement to "immediately"
 """
     
+    def _read_idle_time(self):
+        """
+        Read the screen saver idle time in seconds
+
+        Parses the preferences plist directly with plistlib first - pure
+        Python, no fork/exec - and only shells out to `defaults` when the
+        plist is missing or does not carry the key (e.g. ByHost prefs).
+
+        Returns:
+            Tuple of (idle_seconds or None, error message or None)
+        """
+        try:
+            data = plistlib.loads(_SCREENSAVER_PLIST.read_bytes())
+            if 'idleTime' in data:
+                return int(data['idleTime']), None
+        except (FileNotFoundError, plistlib.InvalidFileException):
+            pass
+
+        result = self._sh(
+            ['defaults', 'read', 'com.apple.screensaver', 'idleTime'],
+            want_err=True
+        )
+        if result.returncode != 0:
+            return None, result.stderr
+        return int(result.stdout.strip()), None
+
     def check(self):
         """Check screen lock timeout settings"""
         try:
             # Check screen saver idle time (in seconds)
-            result = subprocess.run(
-                ['defaults', 'read', 'com.apple.screensaver', 'idleTime'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                idle_seconds = int(result.stdout.strip())
+            idle_seconds, error = self._read_idle_time()
+
+            if idle_seconds is not None:
                 idle_minutes = idle_seconds / 60
                 
                 # CIS recommends 20 minutes or less (1200 seconds)
@@ -85,7 +110,7 @@ To configure screen lock:
                     'finding': 'Screen lock timeout setting not found (may be using system default)',
                     'evidence': {
                         'configured': False,
-                        'error': result.stderr
+                        'error': error
                     },
                     'risk': 'Unclear - unable to verify timeout configuration'
                 }
@@ -2,22 +2,31 @@
 Base class for all security checks
 """
 
+import asyncio
+import subprocess
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 from enum import Enum
 
 
-class CheckStatus(Enum):
-    """Status of a security check"""
+class CheckStatus(str, Enum):
+    """
+    Status of a security check
+
+    str-mixin so members compare, hash and serialize as plain strings
+    without going through the Enum .value descriptor.
+    """
     PASS = "PASS"
     FAIL = "FAIL"
     WARNING = "WARNING"
     ERROR = "ERROR"
     NOT_APPLICABLE = "NOT_APPLICABLE"
 
+    __str__ = str.__str__
+
 
-class Severity(Enum):
+class Severity(str, Enum):
     """Severity levels for findings"""
     CRITICAL = "CRITICAL"
     HIGH = "HIGH"
@@ -25,23 +34,85 @@ class Severity(Enum):
     LOW = "LOW"
     INFO = "INFO"
 
+    __str__ = str.__str__
+
+
+class CheckResult:
+    """
+    Result record returned by check() implementations
+
+    Slotted, so instances carry no __dict__ - noticeably cheaper to
+    allocate than a fresh five-key dict once scans grow to dozens of
+    controls. A plain class with explicit __slots__ rather than
+    @dataclass(slots=True), which needs Python 3.10+ - the documented
+    macOS system python3 is still 3.9. check() may still return a plain
+    dict; run() accepts both.
+    """
+
+    __slots__ = ('status', 'finding', 'evidence', 'risk', 'remediation')
+
+    def __init__(self,
+                 status: CheckStatus = CheckStatus.ERROR,
+                 finding: str = 'No finding recorded',
+                 evidence: Any = None,
+                 risk: str = '',
+                 remediation: Optional[str] = None):
+        self.status = status
+        self.finding = finding
+        self.evidence = evidence
+        self.risk = risk
+        self.remediation = remediation
+
 
 class BaseCheck(ABC):
     """
     Base class for all security compliance checks
-    
+
     All checks must inherit from this class and implement the check() method
     """
-    
+
+    # Metadata defaults. Subclasses may either declare these as class
+    # attributes (shared by every instance, no per-instance allocation) or
+    # assign instance attributes in __init__ as before - instance values
+    # shadow the class-level defaults.
+    id: str = ""
+    title: str = ""
+    description: str = ""
+    category: str = ""
+    severity: Severity = Severity.MEDIUM
+    compliance_frameworks: tuple = ()
+    remediation: str = ""
+
     def __init__(self):
-        self.id: str = ""
-        self.title: str = ""
-        self.description: str = ""
-        self.category: str = ""
-        self.severity: Severity = Severity.MEDIUM
-        self.compliance_frameworks: list = []
-        self.remediation: str = ""
+        # Bind the concrete check() once instead of paying the MRO lookup on
+        # every run; metadata dict is built lazily on first run() because
+        # subclasses populate their fields after super().__init__()
+        self._check_impl = self.check
+        self._meta: Optional[Dict[str, Any]] = None
     
+    @staticmethod
+    def _sh(cmd, want_err=False, timeout=5):
+        """
+        Run a command and capture its output
+
+        Shared launcher for subprocess-based checks: stderr is only piped
+        when the caller inspects it, which saves a pipe and a drain syscall
+        per invocation. The short timeout keeps a stuck binary from
+        stalling a parallel scan.
+
+        Args:
+            cmd: Command argv list
+            want_err: Capture stderr as well (default: discard it)
+            timeout: Seconds before the command is killed
+        """
+        return subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if want_err else subprocess.DEVNULL,
+            text=True,
+            timeout=timeout
+        )
+
     @abstractmethod
     def check(self) -> Dict[str, Any]:
         """
@@ -59,47 +130,99 @@ class BaseCheck(ABC):
         """
         pass
     
+    def _metadata(self) -> Dict[str, Any]:
+        """Copy of the static check metadata, built once on first use"""
+        if self._meta is None:
+            self._meta = {
+                'id': self.id,
+                'title': self.title,
+                'description': self.description,
+                'category': self.category,
+                'severity': self.severity,
+                'compliance_frameworks': self.compliance_frameworks
+            }
+        return self._meta.copy()
+
+    def _format_result(self, result: Union[CheckResult, Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge a check() result (CheckResult or plain dict) with the
+        check metadata"""
+        out = self._metadata()
+        if isinstance(result, CheckResult):
+            out.update(
+                status=result.status,
+                finding=result.finding,
+                evidence=result.evidence,
+                risk=result.risk,
+                remediation=(result.remediation if result.remediation is not None
+                             else self.remediation),
+                timestamp=datetime.now().isoformat(),
+                error=None
+            )
+        else:
+            out.update(
+                status=result.get('status', CheckStatus.ERROR),
+                finding=result.get('finding', 'No finding recorded'),
+                evidence=result.get('evidence'),
+                risk=result.get('risk', ''),
+                remediation=result.get('remediation', self.remediation),
+                timestamp=datetime.now().isoformat(),
+                error=None
+            )
+        return out
+
+    def _format_error(self, exc: Exception) -> Dict[str, Any]:
+        """Build the result for a check whose execution raised"""
+        out = self._metadata()
+        out.update(
+            status=CheckStatus.ERROR,
+            finding='Check execution failed',
+            evidence=None,
+            risk='',
+            remediation='',
+            timestamp=datetime.now().isoformat(),
+            error=str(exc)
+        )
+        return out
+
     def run(self) -> Dict[str, Any]:
         """
         Execute the check and return formatted result
-        
+
         Returns:
             Complete check result with metadata
         """
         try:
-            result = self.check()
-            
-            return {
-                'id': self.id,
-                'title': self.title,
-                'description': self.description,
-                'category': self.category,
-                'severity': self.severity.value,
-                'compliance_frameworks': self.compliance_frameworks,
-                'status': result.get('status', CheckStatus.ERROR).value,
-                'finding': result.get('finding', 'No finding recorded'),
-                'evidence': result.get('evidence'),
-                'risk': result.get('risk', ''),
-                'remediation': result.get('remediation', self.remediation),
-                'timestamp': datetime.now().isoformat(),
-                'error': None
-            }
-            
+            # Formatting stays inside the try so a malformed return value
+            # (None, a dict missing keys) surfaces as an ERROR record
+            # instead of raising out of run()
+            return self._format_result(self._check_impl())
         except Exception as e:
-            return {
-                'id': self.id,
-                'title': self.title,
-                'description': self.description,
-                'category': self.category,
-                'severity': self.severity.value,
-                'status': CheckStatus.ERROR.value,
-                'finding': 'Check execution failed',
-                'evidence': None,
-                'risk': '',
-                'remediation': '',
-                'timestamp': datetime.now().isoformat(),
-                'error': str(e)
-            }
-    
+            return self._format_error(e)
+
+    async def check_async(self) -> Dict[str, Any]:
+        """
+        Async variant of check()
+
+        Default implementation runs the synchronous check() in a worker
+        thread. Subclasses whose hot path is a subprocess can override this
+        with asyncio's native subprocess support.
+        """
+        return await asyncio.to_thread(self.check)
+
+    async def run_async(self) -> Dict[str, Any]:
+        """
+        Execute the check without blocking the event loop
+
+        Awaits check_async() so independent checks gathered together
+        overlap their subprocess waits, then formats the result exactly
+        like run().
+        """
+        try:
+            # As in run(), formatting failures become ERROR records rather
+            # than propagating and aborting a gathered scan
+            return self._format_result(await self.check_async())
+        except Exception as e:
+            return self._format_error(e)
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: {self.id} - {self.title}>"
@@ -3,7 +3,6 @@ CIS macOS Benchmark - Firewall Check
 Control ID: 2.1.1 - Ensure Firewall Is Enabled
 """
 
-import subprocess
 from src.checks.base_check import BaseCheck, CheckStatus, Severity
 
 
@@ -33,27 +32,21 @@ To enable the firewall:
     def check(self):
         """Check firewall status"""
         try:
-            # Check firewall status
-            result = subprocess.run(
-                ['/usr/libexec/ApplicationFirewall/socketfilterfw', '--getglobalstate'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            output = result.stdout.strip().lower()
-            
-            if 'enabled' in output:
-                # Also check stealth mode
-                stealth_result = subprocess.run(
-                    ['/usr/libexec/ApplicationFirewall/socketfilterfw', '--getstealthmode'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
+            # socketfilterfw accepts chained flags, so one invocation reports
+            # both the global state and stealth mode - one fork+exec, not two
+            result = self._sh([
+                '/usr/libexec/ApplicationFirewall/socketfilterfw',
+                '--getglobalstate', '--getstealthmode'
+            ])
+
+            lines = result.stdout.strip().lower().splitlines()
+            firewall_enabled = bool(lines) and 'enabled' in lines[0]
+
+            if firewall_enabled:
+                stealth_enabled = any(
+                    'stealth' in line and 'enabled' in line for line in lines
                 )
-                
-                stealth_enabled = 'enabled' in stealth_result.stdout.lower()
-                
+
                 return {
                     'status': CheckStatus.PASS,
                     'finding': 'Firewall is enabled',
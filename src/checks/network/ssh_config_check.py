@@ -3,11 +3,39 @@ CIS macOS Benchmark - SSH Configuration Check
 Control ID: 4.2 - Ensure SSH Configuration is Secure
 """
 
-import subprocess
+import functools
 import os
+import re
 from src.checks.base_check import BaseCheck, CheckStatus, Severity
 
 
+# Insecure sshd_config directives, compiled once at import. Anchoring at the
+# start of a line (modulo whitespace) means commented-out directives like
+# "#PermitRootLogin yes" no longer count as active settings.
+_SSH_BAD = [
+    (re.compile(r'^\s*PermitRootLogin\s+yes\b', re.IGNORECASE | re.MULTILINE),
+     'Root login is permitted'),
+    (re.compile(r'^\s*PasswordAuthentication\s+yes\b', re.IGNORECASE | re.MULTILINE),
+     'Password authentication is enabled (keys recommended)'),
+    (re.compile(r'^\s*PermitEmptyPasswords\s+yes\b', re.IGNORECASE | re.MULTILINE),
+     'Empty passwords are permitted'),
+]
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_sshd(path: str, mtime: float) -> tuple:
+    """
+    Scan sshd_config for insecure directives
+
+    Cached by (path, mtime): repeated scans in one session cost an os.stat
+    instead of re-reading and re-scanning the file, and any edit to the
+    config invalidates the entry automatically.
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+    return tuple(msg for pattern, msg in _SSH_BAD if pattern.search(content))
+
+
 class SSHConfigCheck(BaseCheck):
     """Check SSH configuration for security best practices"""
     
@@ -38,12 +66,7 @@ To secure or disable SSH:
         """Check SSH service and configuration"""
         try:
             # Check if SSH (Remote Login) is enabled
-            result = subprocess.run(
-                ['sudo', 'systemsetup', '-getremotelogin'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = self._sh(['sudo', 'systemsetup', '-getremotelogin'])
             
             ssh_enabled = 'On' in result.stdout
             
@@ -63,19 +86,9 @@ To secure or disable SSH:
             config_path = '/etc/ssh/sshd_config'
             
             if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config_content = f.read()
-                
-                # Check for insecure settings
-                if 'PermitRootLogin yes' in config_content:
-                    issues.append('Root login is permitted')
-                
-                if 'PasswordAuthentication yes' in config_content:
-                    issues.append('Password authentication is enabled (keys recommended)')
-                
-                if 'PermitEmptyPasswords yes' in config_content:
-                    issues.append('Empty passwords are permitted')
-                
+                # Check for insecure settings (cached until the file changes)
+                issues = list(_parse_sshd(config_path, os.stat(config_path).st_mtime))
+
                 if issues:
                     return {
                         'status': CheckStatus.FAIL,
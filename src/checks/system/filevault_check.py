@@ -3,96 +3,157 @@ CIS macOS Benchmark - FileVault Disk Encryption Check
 Control ID: 2.6.1 - Ensure FileVault Is Enabled
 """
 
-import subprocess
-from src.checks.base_check import BaseCheck, CheckStatus, Severity
+import asyncio
+import re
+import textwrap
+from typing import ClassVar
+from src.checks.base_check import BaseCheck, CheckResult, CheckStatus, Severity
+from src.core.command_cache import run_cmd
+
+
+# Frozen at module load: one shared string for every instance and scan
+_FILEVAULT_REMEDIATION = textwrap.dedent("""\
+    To enable FileVault:
+    1. Open System Settings → Privacy & Security → FileVault
+    2. Click "Turn On FileVault"
+    3. Save recovery key in a secure location
+    4. Restart the system to begin encryption
+    5. Or run: sudo fdesetup enable
+""")
+
+
+# All three known status phrases in one alternation: re's engine walks the
+# output once instead of three sequential substring scans, short-circuiting
+# at the first (usually only) hit
+_FV_STATUS_RE = re.compile(
+    rb'FileVault is (?P<on>On)|FileVault is (?P<off>Off)|'
+    rb'(?P<in_progress>Encryption in progress)'
+)
 
 
 class FileVaultCheck(BaseCheck):
     """Check if FileVault disk encryption is enabled"""
-    
-    def __init__(self):
-        super().__init__()
-        self.id = "CIS-2.6.1"
-        self.title = "Ensure FileVault Is Enabled"
-        self.description = "FileVault provides full disk encryption to protect data at rest"
-        self.category = "Data Protection"
-        self.severity = Severity.CRITICAL
-        self.compliance_frameworks = [
-            "CIS_macOS_14",
-            "NIST_CSF_PR.DS-1",
-            "ISO27001_A.10.1.1",
-            "PCI_DSS_3.4"
-        ]
-        self.remediation = """
-To enable FileVault:
-1. Open System Settings → Privacy & Security → FileVault
-2. Click "Turn On FileVault"
-3. Save recovery key in a secure location
-4. Restart the system to begin encryption
-5. Or run: sudo fdesetup enable
-"""
-    
+
+    # Static metadata as class attributes: every instance shares these
+    # objects instead of allocating fresh ones per construction
+    id: ClassVar[str] = "CIS-2.6.1"
+    title: ClassVar[str] = "Ensure FileVault Is Enabled"
+    description: ClassVar[str] = "FileVault provides full disk encryption to protect data at rest"
+    category: ClassVar[str] = "Data Protection"
+    severity: ClassVar[Severity] = Severity.CRITICAL
+    compliance_frameworks: ClassVar[tuple] = (
+        "CIS_macOS_14",
+        "NIST_CSF_PR.DS-1",
+        "ISO27001_A.10.1.1",
+        "PCI_DSS_3.4"
+    )
+    remediation: ClassVar[str] = _FILEVAULT_REMEDIATION
+
     def check(self):
         """Check FileVault encryption status"""
         try:
-            # Check FileVault status
-            result = subprocess.run(
-                ['fdesetup', 'status'],
-                capture_output=True,
-                text=True,
-                timeout=10
+            # Check FileVault status (memoized for the duration of the scan).
+            # Output is kept as bytes - it is one short known ASCII line, so
+            # matching bytes skips a UTF-8 decode pass
+            result = run_cmd(('fdesetup', 'status'), timeout=10, text=False)
+            return self._classify(result.stdout.strip())
+
+        except Exception as e:
+            return CheckResult(
+                status=CheckStatus.ERROR,
+                finding='Could not check FileVault status',
+                evidence={'error': str(e)},
+                risk='Unable to verify disk encryption'
             )
-            
-            output = result.stdout.strip()
-            
-            if 'FileVault is On' in output:
-                return {
-                    'status': CheckStatus.PASS,
-                    'finding': 'FileVault disk encryption is enabled',
-                    'evidence': {
-                        'filevault_enabled': True,
-                        'status': output
-                    },
-                    'risk': 'None'
-                }
-            elif 'FileVault is Off' in output:
-                return {
-                    'status': CheckStatus.FAIL,
-                    'finding': 'FileVault disk encryption is DISABLED',
-                    'evidence': {
-                        'filevault_enabled': False,
-                        'status': output
-                    },
-                    'risk': 'CRITICAL - Data at rest is not encrypted. If device is lost or stolen, all data is accessible.'
-                }
-            elif 'Encryption in progress' in output:
-                return {
-                    'status': CheckStatus.WARNING,
-                    'finding': 'FileVault encryption is in progress',
-                    'evidence': {
-                        'filevault_enabled': True,
-                        'encryption_in_progress': True,
-                        'status': output
-                    },
-                    'risk': 'Low - Encryption is being applied but not yet complete'
-                }
-            else:
-                return {
-                    'status': CheckStatus.WARNING,
-                    'finding': 'FileVault status unclear',
-                    'evidence': {
-                        'status': output
-                    },
-                    'risk': 'Unable to determine encryption status'
-                }
-                
+
+    async def check_async(self):
+        """
+        Check FileVault encryption status without blocking the event loop
+
+        Native asyncio subprocess path: awaiting proc.communicate() lets
+        other checks progress while fdesetup runs, instead of parking a
+        worker thread on a blocking subprocess.run.
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'fdesetup', 'status',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                out, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                # wait_for only cancels the read; kill the child too so a
+                # hung fdesetup does not outlive the scan with open pipes
+                # (subprocess.run does this for the sync path)
+                proc.kill()
+                await proc.wait()
+                return CheckResult(
+                    status=CheckStatus.ERROR,
+                    finding='Could not check FileVault status',
+                    evidence={'error': 'Command timeout after 10 seconds'},
+                    risk='Unable to verify disk encryption'
+                )
+            return self._classify(out.strip())
+
         except Exception as e:
-            return {
-                'status': CheckStatus.ERROR,
-                'finding': 'Could not check FileVault status',
-                'evidence': {'error': str(e)},
-                'risk': 'Unable to verify disk encryption'
-            }
+            return CheckResult(
+                status=CheckStatus.ERROR,
+                finding='Could not check FileVault status',
+                evidence={'error': str(e)},
+                risk='Unable to verify disk encryption'
+            )
+
+    def _classify(self, output: bytes):
+        """Map raw fdesetup status output to a check result
+
+        Dispatches on a single combined-pattern scan; the alternation's
+        named groups say which status phrase matched."""
+        status_str = output.decode('ascii', 'replace')
+
+        match = _FV_STATUS_RE.search(output)
+        state = match.lastgroup if match else None
+
+        if state == 'on':
+            return CheckResult(
+                status=CheckStatus.PASS,
+                finding='FileVault disk encryption is enabled',
+                evidence={
+                    'filevault_enabled': True,
+                    'status': status_str
+                },
+                risk='None'
+            )
+        elif state == 'off':
+            return CheckResult(
+                status=CheckStatus.FAIL,
+                finding='FileVault disk encryption is DISABLED',
+                evidence={
+                    'filevault_enabled': False,
+                    'status': status_str
+                },
+                risk='CRITICAL - Data at rest is not encrypted. If device is lost or stolen, all data is accessible.'
+            )
+        elif state == 'in_progress':
+            return CheckResult(
+                status=CheckStatus.WARNING,
+                finding='FileVault encryption is in progress',
+                evidence={
+                    'filevault_enabled': True,
+                    'encryption_in_progress': True,
+                    'status': status_str
+                },
+                risk='Low - Encryption is being applied but not yet complete'
+            )
+        else:
+            return CheckResult(
+                status=CheckStatus.WARNING,
+                finding='FileVault status unclear',
+                evidence={
+                    'status': status_str
+                },
+                risk='Unable to determine encryption status'
+            )
 
 
 if __name__ == "__main__":
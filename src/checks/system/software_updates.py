@@ -3,115 +3,220 @@ CIS macOS Benchmark - Software Updates Check
 Control ID: 1.1 - Ensure All Apple-Provided Software Is Current
 """
 
+import fcntl
+import functools
+import hashlib
+import json
+import re
 import subprocess
-from src.checks.base_check import BaseCheck, CheckStatus, Severity
+import textwrap
+import time
+from pathlib import Path
+from typing import ClassVar, Optional
+from src.checks.base_check import BaseCheck, CheckResult, CheckStatus, Severity
+from src.core.command_cache import run_cmd
+
+
+# Update entries in `softwareupdate -l` output: either "Label: <name>" or
+# "* <name>" lines (with the name after the first colon, when present).
+# Compiled once so parsing is a single multiline pass over the output.
+_UPDATE_RE = re.compile(r'^\s*(?:Label:|\*(?:[^:\n]*:)?)\s*(.+?)\s*$', re.MULTILINE)
+
+# Frozen at module load: one shared string for every instance and scan
+_UPDATES_REMEDIATION = textwrap.dedent("""\
+    To install updates:
+    1. Open System Settings → General → Software Update
+    2. Install all available updates
+    3. Or run: sudo softwareupdate -ia --restart
+    4. Enable automatic updates for security patches
+""")
+
+# Case-insensitive matchers so the multi-KB output is never copied just to
+# lowercase it for a substring test
+_NO_UPDATES_RE = re.compile(r'no (?:new software|updates) available', re.IGNORECASE)
+_SECURITY_RE = re.compile(r'security', re.IGNORECASE)
+
+# softwareupdate -l queries Apple's update server and is by far the slowest
+# check, so its output is cached to disk across processes (cron runs,
+# repeated CLI scans). Entries older than the TTL, or whose integrity hash
+# does not match, are ignored.
+@functools.lru_cache(maxsize=32)
+def _parse_updates(output: str) -> tuple:
+    """Parse update names from softwareupdate output
+
+    Pure function of the output, memoized so repeated classification of
+    identical (cached) output skips the regex pass. The single finditer
+    pass also avoids the line-list and per-line strip() allocations of the
+    old split-based parser (~3 string objects per line). Returns a tuple
+    so the cached value is immutable."""
+    return tuple(m.group(1) for m in _UPDATE_RE.finditer(output))
+
+
+@functools.lru_cache(maxsize=32)
+def _has_security(output: str) -> bool:
+    """Whether the output mentions a security update (memoized)"""
+    return bool(_SECURITY_RE.search(output))
+
+
+_CACHE_DIR = Path.home() / '.cache' / 'complianceguard'
+_CACHE_FILE = _CACHE_DIR / 'softwareupdate.json'
+# Sidecar lock serializing the miss -> run -> write path across processes
+_LOCK_FILE = _CACHE_DIR / 'softwareupdate.lock'
+_CACHE_TTL = 3600  # seconds
+
+
+def _read_cached_output() -> Optional[str]:
+    """Return cached softwareupdate output if fresh and intact, else None"""
+    try:
+        with open(_CACHE_FILE, 'r') as f:
+            fcntl.flock(f, fcntl.LOCK_SH)
+            try:
+                entry = json.load(f)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    except (OSError, ValueError):
+        return None
+
+    output = entry.get('output')
+    if not isinstance(output, str):
+        return None
+    if time.time() - entry.get('ts', 0) > _CACHE_TTL:
+        return None
+    if hashlib.sha256(output.encode()).hexdigest() != entry.get('sha256'):
+        return None
+    return output
+
+
+def _write_cached_output(output: str):
+    """Persist softwareupdate output with timestamp and integrity hash
+    (best effort - a read-only home directory just skips caching)"""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 'a+' so the file is not truncated before the lock is held;
+        # truncate only once we own it, so readers never see a torn write
+        with open(_CACHE_FILE, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                f.truncate()
+                json.dump({
+                    'ts': time.time(),
+                    'sha256': hashlib.sha256(output.encode()).hexdigest(),
+                    'output': output
+                }, f)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    except OSError:
+        pass
+
+
+def _get_output() -> str:
+    """Return softwareupdate output, from the cross-process cache when
+    fresh, running the command on a miss
+
+    A fresh cache entry is returned without any exclusive locking. On a
+    miss the whole miss -> run -> write path runs under the sidecar lock,
+    so two processes that both miss coalesce: the second blocks on the
+    lock, re-reads, and picks up the first's result instead of running
+    the 30-second command a second time."""
+    output = _read_cached_output()
+    if output is not None:
+        return output
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        lock = open(_LOCK_FILE, 'a+')
+    except OSError:
+        # No usable cache directory - run uncoalesced, skip caching
+        return run_cmd(('softwareupdate', '-l'), timeout=30).stdout
+
+    with lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            # Another process may have filled the cache while we waited
+            output = _read_cached_output()
+            if output is None:
+                output = run_cmd(('softwareupdate', '-l'), timeout=30).stdout
+                _write_cached_output(output)
+            return output
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
 
 
 class SoftwareUpdatesCheck(BaseCheck):
     """Check if macOS software updates are current"""
-    
-    def __init__(self):
-        super().__init__()
-        self.id = "CIS-1.1"
-        self.title = "Ensure All Apple-Provided Software Is Current"
-        self.description = "Software updates often contain security patches for vulnerabilities"
-        self.category = "System Updates"
-        self.severity = Severity.HIGH
-        self.compliance_frameworks = [
-            "CIS_macOS_14",
-            "NIST_CSF_PR.IP-12",
-            "ISO27001_A.12.6.1"
-        ]
-        self.remediation = """
-To install updates:
-1. Open System Settings → General → Software Update
-2. Install all available updates
-3. Or run: sudo softwareupdate -ia --restart
-4. Enable automatic updates for security patches
-"""
-    
+
+    # Static metadata as class attributes: every instance shares these
+    # objects instead of allocating fresh ones per construction
+    id: ClassVar[str] = "CIS-1.1"
+    title: ClassVar[str] = "Ensure All Apple-Provided Software Is Current"
+    description: ClassVar[str] = "Software updates often contain security patches for vulnerabilities"
+    category: ClassVar[str] = "System Updates"
+    severity: ClassVar[Severity] = Severity.HIGH
+    compliance_frameworks: ClassVar[tuple] = (
+        "CIS_macOS_14",
+        "NIST_CSF_PR.IP-12",
+        "ISO27001_A.12.6.1"
+    )
+    remediation: ClassVar[str] = _UPDATES_REMEDIATION
+
     def check(self):
         """Check for available software updates"""
         try:
-            # Check for available updates
-            result = subprocess.run(
-                ['softwareupdate', '-l'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            output = result.stdout.lower()
-            
+            # Reuse the cross-process disk cache when fresh; misses run the
+            # (per-scan memoized) command under the sidecar lock
+            output = _get_output()
+
             # Check if system is up to date
-            if "no new software available" in output or "no updates available" in output:
-                return {
-                    'status': CheckStatus.PASS,
-                    'finding': 'System is up to date - no pending updates',
-                    'evidence': {
+            if _NO_UPDATES_RE.search(output):
+                return CheckResult(
+                    status=CheckStatus.PASS,
+                    finding='System is up to date - no pending updates',
+                    evidence={
                         'updates_available': 0,
-                        'output': result.stdout[:200]
+                        'output': output[:200]
                     },
-                    'risk': 'None'
-                }
+                    risk='None'
+                )
             
+            # Check for security updates on the raw output up front rather
+            # than lowercasing every parsed entry
+            has_security_updates = _has_security(output)
+
             # Parse available updates
-            updates = self._parse_updates(result.stdout)
-            
-            # Check if there are recommended/security updates
-            has_security_updates = any('security' in u.lower() for u in updates)
+            updates = _parse_updates(output)
             
             if has_security_updates:
                 severity_msg = "CRITICAL - Security updates available"
             else:
                 severity_msg = f"{len(updates)} update(s) available"
             
-            return {
-                'status': CheckStatus.FAIL,
-                'finding': severity_msg,
-                'evidence': {
+            return CheckResult(
+                status=CheckStatus.FAIL,
+                finding=severity_msg,
+                evidence={
                     'updates_available': len(updates),
-                    'updates': updates[:5],  # Show first 5
+                    'updates': list(updates[:5]),  # Show first 5
                     'has_security_updates': has_security_updates
                 },
-                'risk': 'Outdated software may contain known vulnerabilities that can be exploited by attackers'
-            }
+                risk='Outdated software may contain known vulnerabilities that can be exploited by attackers'
+            )
             
         except subprocess.TimeoutExpired:
-            return {
-                'status': CheckStatus.ERROR,
-                'finding': 'Software update check timed out',
-                'evidence': {'error': 'Command timeout after 30 seconds'},
-                'risk': 'Unable to verify update status'
-            }
+            return CheckResult(
+                status=CheckStatus.ERROR,
+                finding='Software update check timed out',
+                evidence={'error': 'Command timeout after 30 seconds'},
+                risk='Unable to verify update status'
+            )
         except Exception as e:
-            return {
-                'status': CheckStatus.ERROR,
-                'finding': 'Could not check software updates',
-                'evidence': {'error': str(e)},
-                'risk': 'Unable to verify update status'
-            }
+            return CheckResult(
+                status=CheckStatus.ERROR,
+                finding='Could not check software updates',
+                evidence={'error': str(e)},
+                risk='Unable to verify update status'
+            )
     
-    def _parse_updates(self, output: str) -> list:
-        """Parse update list from softwareupdate output"""
-        updates = []
-        lines = output.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            # Look for lines with asterisk (update entries)
-            if line.startswith('*') or line.startswith('Label:'):
-                # Extract update name
-                if ':' in line:
-                    update_name = line.split(':', 1)[1].strip()
-                else:
-                    update_name = line.lstrip('* ').strip()
-                
-                if update_name:
-                    updates.append(update_name)
-        
-        return updates
-
 
 if __name__ == "__main__":
     # Test this check
@@ -0,0 +1,37 @@
+"""
+Memoized subprocess execution for ComplianceGuard
+"""
+
+import functools
+import subprocess
+
+
+@functools.lru_cache(maxsize=64)
+def run_cmd(argv: tuple, timeout: int = 10, text: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run a command and cache the completed result by its argv
+
+    System state does not change within one scan, so checks that shell out
+    to the same binary reuse the first result instead of forking again.
+    Exceptions (timeouts, missing binaries) are never cached, so transient
+    failures are retried on the next call.
+
+    Args:
+        argv: Command argv as a tuple (must be hashable for the cache)
+        timeout: Seconds before the command is killed
+        text: Decode output to str (pass False to keep raw bytes)
+
+    Returns:
+        The CompletedProcess from the first invocation
+    """
+    return subprocess.run(
+        list(argv),
+        capture_output=True,
+        text=text,
+        timeout=timeout
+    )
+
+
+def clear_cache():
+    """Drop all memoized command results (call at the start of a fresh scan)"""
+    run_cmd.cache_clear()
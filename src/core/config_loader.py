@@ -2,57 +2,94 @@
 Configuration management for ComplianceGuard
 """
 
+import mmap
 import yaml
 import os
 from typing import Dict, Any
 from pathlib import Path
 
+# Below this size the mmap setup costs more than it saves; read normally
+_MMAP_THRESHOLD = 4096
+
+
+# libyaml's C loader parses several times faster than the pure Python one;
+# fall back when PyYAML was built without the extension
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Sentinel distinguishing "key absent" from a stored None in the cache
+_MISSING = object()
+
+
+def _iter_flat(config: Dict[str, Any], prefix: str = ''):
+    """Recursively yield ('a.b.c', value) pairs for every node in a nested
+    dict - leaves and intermediate sections alike"""
+    for k, v in config.items():
+        key = prefix + k
+        yield key, v
+        if isinstance(v, dict):
+            yield from _iter_flat(v, key + '.')
+
 
 class ConfigLoader:
     """Loads and validates configuration from YAML file"""
-    
+
+    # Parsed configs keyed by (abspath, mtime_ns): instantiating many
+    # loaders against an unchanged file parses it exactly once
+    _cache: Dict[tuple, Dict[str, Any]] = {}
+
     def __init__(self, config_path: str = "config.yaml"):
         """
         Initialize configuration loader
-        
+
         Args:
             config_path: Path to configuration YAML file
         """
         self.config_path = config_path
-        self.config = self._load_config()
-    
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
-        if not os.path.exists(self.config_path):
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
+        self.config = self._load_config(config_path)
+        # Flattened view built once: get() becomes a single dict lookup
+        # instead of a per-call key split and nested traversal
+        self._flat = dict(_iter_flat(self.config)) if self.config else {}
+
+    @classmethod
+    def _load_config(cls, config_path: str) -> Dict[str, Any]:
+        """Load configuration from YAML file, reusing the cached parse
+        while the file's mtime is unchanged"""
+        if not os.path.exists(config_path):
+            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+        stat = os.stat(config_path)
+        key = (os.path.abspath(config_path), stat.st_mtime_ns)
+        config = cls._cache.get(key)
+        if config is None:
+            with open(config_path, 'rb') as f:
+                if stat.st_size >= _MMAP_THRESHOLD:
+                    # Parse straight out of the mapped file - no extra copy
+                    # of the whole document in a Python string
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        config = yaml.load(mm, Loader=_YAML_LOADER)
+                    finally:
+                        mm.close()
+                else:
+                    config = yaml.load(f, Loader=_YAML_LOADER)
+            cls._cache[key] = config
+
         return config
-    
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value by dot-notation key
-        
+
         Args:
             key: Configuration key (e.g., 'scanning.frameworks')
             default: Default value if key not found
-            
+
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-        
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            return default
         return value
     
     def get_scanning_config(self) -> Dict:
@@ -68,9 +105,27 @@ class ConfigLoader:
         return self.config.get('scoring', {})
 
 
+_INSTANCE = None
+
+
+def get_config(config_path: str = "config.yaml") -> ConfigLoader:
+    """
+    Shared ConfigLoader instance
+
+    Callers that each built their own ConfigLoader repeated the load path
+    (and, before caching, the YAML parse) per construction. This returns a
+    process-wide instance, rebuilt only when a different path is requested;
+    the mtime-keyed parse cache still picks up edits to the file.
+    """
+    global _INSTANCE
+    if _INSTANCE is None or _INSTANCE.config_path != config_path:
+        _INSTANCE = ConfigLoader(config_path)
+    return _INSTANCE
+
+
 if __name__ == "__main__":
     # Test configuration loader
-    config = ConfigLoader()
+    config = get_config()
     print("Configuration loaded successfully")
     print(f"Frameworks: {config.get('scanning.frameworks')}")
     print(f"Report formats: {config.get('reporting.formats')}")
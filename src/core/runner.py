@@ -0,0 +1,30 @@
+"""
+Concurrent check execution for ComplianceGuard
+"""
+
+import asyncio
+
+
+async def run_all(checks, max_concurrency: int = 8) -> list:
+    """
+    Run checks concurrently with a bounded fan-out
+
+    Gathers every check's run_async under a semaphore so scans stay
+    parallel without spawning an unbounded number of subprocesses at once
+    (a full CIS benchmark runs 60+ controls - unbounded fan-out would
+    exhaust file descriptors and fork-storm the host).
+
+    Args:
+        checks: Iterable of BaseCheck instances
+        max_concurrency: Maximum number of checks in flight at once
+
+    Returns:
+        Result dicts in the same order as the input checks
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(check):
+        async with semaphore:
+            return await check.run_async()
+
+    return list(await asyncio.gather(*(_one(check) for check in checks)))
@@ -3,8 +3,11 @@
 Test all implemented security checks
 """
 
+import asyncio
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Ensure project root is in path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -14,91 +17,145 @@ from src.checks.network.firewall_check import FirewallCheck
 from src.checks.system.filevault_check import FileVaultCheck
 from src.checks.access_control.screen_lock_check import ScreenLockCheck
 from src.checks.network.ssh_config_check import SSHConfigCheck
+from src.core.command_cache import clear_cache
+from src.core.runner import run_all
 from rich.console import Console
 from rich.table import Table
 
 
-def main():
-    """Run all checks and display results"""
-    console = Console()
-    
-    console.print("\n[bold blue]ComplianceGuard - Running All Checks[/bold blue]\n")
-    
-    # List of all checks
-    checks = [
-        SoftwareUpdatesCheck(),
-        FirewallCheck(),
-        FileVaultCheck(),
-        ScreenLockCheck(),
-        SSHConfigCheck()
-    ]
-    
-    results = []
-    
-    # Run each check
-    for check in checks:
-        console.print(f"🔍 Running: [bold]{check.title}[/bold]")
-        result = check.run()
-        results.append(result)
-        
-        # Display status
+# All registered checks, in display order
+CHECK_CLASSES = [
+    SoftwareUpdatesCheck,
+    FirewallCheck,
+    FileVaultCheck,
+    ScreenLockCheck,
+    SSHConfigCheck
+]
+
+
+# Pre-styled status cells, built once: rendering is a dict lookup instead
+# of an if/elif ladder re-evaluated for every row of every scan
+_STATUS_DISPLAY = {
+    'PASS': "✅ PASS",
+    'FAIL': "❌ FAIL",
+    'WARNING': "⚠️  WARN",
+}
+_STATUS_FALLBACK = "❓ ERROR"
+
+# Per-finding line icons, same idea
+_STATUS_ICONS = {
+    'PASS': '✅',
+    'FAIL': '❌',
+    'WARNING': '⚠️ ',
+}
+
+
+def _run_check(check_cls):
+    """Instantiate and run a check (module-level so it pickles for process pools)"""
+    return check_cls().run()
+
+
+def run_checks_in_processes(check_classes):
+    """
+    Run checks in a process pool
+
+    Fallback for environments where the asyncio path is unavailable (e.g.
+    when called from code that already owns an event loop). Results come
+    back in submission order regardless of completion order.
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=len(check_classes)) as executor:
+        futures = {executor.submit(_run_check, cls): cls for cls in check_classes}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return [results[cls] for cls in check_classes]
+
+
+def display_results(console, results):
+    """Render per-check findings, the summary table and the score"""
+    # Buffer the per-check lines and emit once - one render pass and one
+    # stdout flush instead of a console.print per check
+    lines = []
+    for result in results:
         status = result['status']
-        if status == 'PASS':
-            console.print(f"   ✅ {status}: {result['finding']}\n")
-        elif status == 'FAIL':
-            console.print(f"   ❌ {status}: {result['finding']}\n")
-        elif status == 'WARNING':
-            console.print(f"   ⚠️  {status}: {result['finding']}\n")
-        else:
-            console.print(f"   ❓ {status}: {result['finding']}\n")
-    
+        icon = _STATUS_ICONS.get(status, '❓')
+        lines.append(f"   {icon} {status}: {result['finding']}\n")
+    console.print("\n".join(lines))
+
     # Summary table
     console.print("\n[bold]Summary:[/bold]\n")
-    
+
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID", style="cyan")
     table.add_column("Check", style="white")
     table.add_column("Status", style="white")
     table.add_column("Severity", style="yellow")
-    
-    pass_count = 0
-    fail_count = 0
-    warning_count = 0
-    
+
+    # Single counting pass; the per-status tallies fall out of one Counter
+    # instead of three manually maintained counters
+    counts = Counter(result['status'] for result in results)
+
+    # Build the rows first, then add them in a tight loop, keeping row
+    # construction separate from table population
+    rows = []
     for result in results:
-        status = result['status']
-        if status == 'PASS':
-            status_display = "✅ PASS"
-            pass_count += 1
-        elif status == 'FAIL':
-            status_display = "❌ FAIL"
-            fail_count += 1
-        elif status == 'WARNING':
-            status_display = "⚠️  WARN"
-            warning_count += 1
-        else:
-            status_display = "❓ ERROR"
-        
-        table.add_row(
+        rows.append((
             result['id'],
             result['title'][:50] + "..." if len(result['title']) > 50 else result['title'],
-            status_display,
+            _STATUS_DISPLAY.get(result['status'], _STATUS_FALLBACK),
             result['severity']
-        )
-    
+        ))
+
+    for row in rows:
+        table.add_row(*row)
+
     console.print(table)
-    
+
     # Statistics
     total = len(results)
     console.print(f"\n[bold]Results:[/bold]")
     console.print(f"  Total Checks: {total}")
-    console.print(f"  ✅ Passed: {pass_count}")
-    console.print(f"  ❌ Failed: {fail_count}")
-    console.print(f"  ⚠️  Warnings: {warning_count}")
-    
-    compliance_score = (pass_count / total) * 100 if total > 0 else 0
+    console.print(f"  ✅ Passed: {counts['PASS']}")
+    console.print(f"  ❌ Failed: {counts['FAIL']}")
+    console.print(f"  ⚠️  Warnings: {counts['WARNING']}")
+
+    compliance_score = (counts['PASS'] / total) * 100 if total > 0 else 0
     console.print(f"\n[bold]Compliance Score: {compliance_score:.1f}%[/bold]\n")
 
 
+async def main():
+    """Run all checks and display results"""
+    console = Console()
+
+    console.print("\n[bold blue]ComplianceGuard - Running All Checks[/bold blue]\n")
+
+    # Fresh scan: drop memoized command results from any previous cycle
+    clear_cache()
+
+    # Checks are independent and I/O-bound on subprocesses, so running them
+    # concurrently collapses wall time to roughly the slowest check
+    checks = [cls() for cls in CHECK_CLASSES]
+    console.print("\n".join(
+        f"🔍 Running: [bold]{check.title}[/bold]" for check in checks
+    ))
+
+    results = await run_all(checks)
+
+    console.print()
+    display_results(console, results)
+
+
+def main_processes():
+    """Run all checks in worker processes and display results"""
+    console = Console()
+
+    console.print("\n[bold blue]ComplianceGuard - Running All Checks[/bold blue]\n")
+    results = run_checks_in_processes(CHECK_CLASSES)
+    display_results(console, results)
+
+
 if __name__ == "__main__":
-    main()
+    if '--processes' in sys.argv[1:]:
+        main_processes()
+    else:
+        asyncio.run(main())